@@ -153,12 +153,13 @@ class Application(Component):
 
     @classmethod  # noqa: C901
     @click.pass_context
-    def from_workdir(ctx, cls, workdir=None, force_init=False, use_versions=[]):
+    def from_workdir(ctx, cls, workdir=None, force_init=False, use_versions=[],
+                     filenames=None):
         if workdir is None:
             workdir = ctx.obj.workdir
 
         config = load_config(
-            find_config(workdir, None, ctx.obj.env),
+            find_config(workdir, filenames, ctx.obj.env),
             use_versions=use_versions
         )
 
@@ -34,13 +34,16 @@ from __future__ import unicode_literals
 
 import os
 import sys
+import traceback
+from itertools import chain
 
 import click
-import inquirer
 
 from kraft.app import Application
 from kraft.cmd.list import kraft_list_preflight
 from kraft.cmd.list.pull import kraft_list_pull
+from kraft.config.config import get_default_config_files
+from kraft.const import DOT_CONFIG
 from kraft.const import KCONFIG
 from kraft.const import KCONFIG_EQ
 from kraft.const import KCONFIG_N
@@ -48,8 +51,14 @@ from kraft.const import KCONFIG_Y
 from kraft.error import CannotConfigureApplication
 from kraft.error import KraftError
 from kraft.error import MissingComponent
+from kraft.error import UnknownTarget
 from kraft.logger import logger
 
+# Parsed applications keyed by (workdir, use_versions), so that re-entrant
+# configure invocations (e.g. after pulling a missing component) do not
+# re-parse an unchanged kraft.yaml.
+_app_cache = dict()
+
 
 @click.command('configure', short_help='Configure the application.')  # noqa: C901
 @click.option(
@@ -117,6 +126,11 @@ def cmd_configure(ctx, target=None, plat=None, arch=None, force_configure=False,
 
     When the unikernel is configured, a .config file is written to the working
     directory with the selected KConfig options.
+
+    Set KRAFT_SKIP_IF_CONFIGURED=1 to leave an existing .config untouched,
+    e.g. when re-running scripted builds.  It has no effect with -F|--force,
+    -k|--menuconfig, or when options, a target, an architecture or a platform
+    are given on the command line.
     """
 
     kraft_list_preflight()
@@ -124,25 +138,30 @@ def cmd_configure(ctx, target=None, plat=None, arch=None, force_configure=False,
     if workdir is None:
         workdir = os.getcwd()
 
+    kconfig_prefix = KCONFIG % ''
     options = list()
-    for y in yes:
-        if not y.startswith(KCONFIG):
-            y = KCONFIG % y
-        options.append(KCONFIG_EQ % (y, KCONFIG_Y))
-    for n in no:
-        if not n.startswith(KCONFIG):
-            n = KCONFIG % n
-        if n in options:
-            logger.critical('Cannot specify same option with multiple values: %s' % n)
+    seen_keys = set()
+    for opt, value in chain(((y, KCONFIG_Y) for y in yes),
+                            ((n, KCONFIG_N) for n in no),
+                            ((o, None) for o in opts)):
+        if not opt.startswith(kconfig_prefix):
+            opt = kconfig_prefix + opt
+
+        # Values passed via --set are part of the option itself
+        if value is not None:
+            key = opt
+        elif '=' not in opt:
+            logger.critical('Missing value for --set option: %s' % opt)
             sys.exit(1)
-        options.append(KCONFIG_EQ % (n, KCONFIG_N))
-    for o in opts:
-        if not o.startswith(KCONFIG):
-            o = KCONFIG % o
-        if '=' not in o:
-            logger.critical('Missing value for --set option: %s' % o)
+        else:
+            key, value = opt.split('=', 1)
+
+        if key in seen_keys:
+            logger.critical('Cannot specify same option with multiple values: %s' % key)
             sys.exit(1)
-        options.append(o)
+
+        seen_keys.add(key)
+        options.append(KCONFIG_EQ % (key, value))
 
     try:
         kraft_configure(
@@ -170,28 +189,19 @@ def cmd_configure(ctx, target=None, plat=None, arch=None, force_configure=False,
                     skip_app=True
                 )
             except Exception:
-                if ctx.obj.verbose:
-                    import traceback
-                    logger.critical(traceback.format_exc())
-
+                _log_traceback_if_verbose(ctx)
                 sys.exit(1)
 
             # Try to configure again
             ctx.forward(cmd_configure, force_configure=True)
 
-        elif ctx.obj.verbose:
-            import traceback
-            logger.critical(traceback.format_exc())
-
+        else:
+            _log_traceback_if_verbose(ctx)
             sys.exit(1)
 
     except Exception as e:
         logger.critical(str(e))
-
-        if ctx.obj.verbose:
-            import traceback
-            logger.critical(traceback.format_exc())
-
+        _log_traceback_if_verbose(ctx)
         sys.exit(1)
 
 
@@ -207,9 +217,23 @@ def kraft_configure(ctx, env=None, workdir=None, target=None, plat=None,
     if workdir is None or os.path.exists(workdir) is False:
         raise ValueError("working directory is empty: %s" % workdir)
 
+    # Allow scripted re-runs to skip already configured applications without
+    # parsing their kraft.yaml at all.
+    if force_configure is False and show_menuconfig is False \
+            and ctx.obj.env.get_boolean('KRAFT_SKIP_IF_CONFIGURED') \
+            and os.path.exists(os.path.join(workdir, DOT_CONFIG)):
+        if options or use_versions or target or arch or plat:
+            logger.warning(
+                "Ignoring KRAFT_SKIP_IF_CONFIGURED as configuration was "
+                "requested on the command line"
+            )
+        else:
+            logger.info("%s is already configured, skipping..." % workdir)
+            return
+
     logger.debug("Configuring %s..." % workdir)
 
-    app = Application.from_workdir(
+    app = _load_app_cached(
         workdir=workdir,
         force_init=force_configure,
         use_versions=use_versions,
@@ -221,56 +245,75 @@ def kraft_configure(ctx, env=None, workdir=None, target=None, plat=None,
         else:
             raise KraftError("Cannot open menuconfig in non-TTY environment")
 
-    if app.is_configured() and force_configure is False:
-        if click.confirm("%s is already configured, would you like to overwrite configuration?" % workdir): # noqa
+    if force_configure is False and app.is_configured():
+        try:
+            overwrite = click.confirm("%s is already configured, would you like to overwrite configuration?" % workdir) # noqa
+        except click.Abort:
+            # No answer could be read, e.g. stdin is closed in a script
+            overwrite = False
+
+        if overwrite:
             force_configure = True
         else:
             raise CannotConfigureApplication(workdir)
 
-    if len(app.config.targets.all()) == 1:
-        target = app.config.targets.all()[0]
+    targets = list(app.config.targets.all())
+
+    if len(targets) == 1:
+        target = targets[0]
 
     elif len(app.binaries) == 1:
         target = app.binaries[0]
 
-    else:
-        for t in app.config.targets.all():
-            # Did the user specific a target-name?
-            if target is not None and target == t.name:
-                target = t
-                break
+    # Did the user specify a target-name?  Does it exist?
+    elif target is not None:
+        by_name = dict()
+        for t in targets:
+            if t.name is not None:
+                by_name.setdefault(t.name, t)
 
-            # Did the user specify arch AND plat combo? Does it exist?
-            elif arch == t.architecture.name \
-                    and plat == t.platform.name:
-                target = t
-                break
+        if target not in by_name:
+            raise UnknownTarget(target)
 
-    # The user did not specify something
-    if target is None:
-        binaries = []
+        target = by_name[target]
 
-        for t in app.binaries:
-            binname = os.path.basename(t.binary)
-            if t.name is not None:
-                binname = "%s (%s)" % (binname, t.name)
+    # Did the user specify arch AND plat combo?  Does it exist?
+    elif arch is not None and plat is not None:
+        by_archplat = dict()
+        for t in targets:
+            by_archplat.setdefault((t.architecture.name, t.platform.name), t)
 
-            binaries.append(binname)
+        target = by_archplat.get((arch, plat), None)
+
+    # The user did not specify something
+    if target is None:
+        binaries = app.binaries
+        basenames = [os.path.basename(t.binary) for t in binaries]
+        choices = [
+            "%s (%s)" % (bn, t.name) if t.name is not None else bn
+            for bn, t in zip(basenames, binaries)
+        ]
 
         # Prompt user for binary selection
+        import inquirer
         answers = inquirer.prompt([
             inquirer.List(
                 'target',
                 message="Which target would you like to configure?",
-                choices=binaries,
+                choices=choices,
             ),
         ])
 
-        # Work backwards from binary name
-        for t in app.binaries:
-            if answers['target'] == os.path.basename(t.binary):
-                target = t
-                break
+        # Work backwards from the selected choice
+        by_choice = dict()
+        for choice, t in zip(choices, binaries):
+            by_choice.setdefault(choice, t)
+
+        choice = (answers or dict()).get('target', None)
+        if choice not in by_choice:
+            raise UnknownTarget(choice)
+
+        target = by_choice[choice]
 
     app.configure(
         target=target,
@@ -279,3 +322,44 @@ def kraft_configure(ctx, env=None, workdir=None, target=None, plat=None,
     )
 
     app.save_yaml()
+
+
+def _load_app_cached(workdir=None, force_init=False, use_versions=[]):
+    """
+    Returns the Application for the given working directory, re-using a
+    previously parsed instance if its kraft.yaml has not been modified since.
+    """
+
+    key = (workdir, tuple(use_versions))
+    kraftfile = os.path.abspath(get_default_config_files(workdir)[0])
+    mtime = os.stat(kraftfile).st_mtime_ns
+
+    if key in _app_cache:
+        cached_mtime, cached_force_init, app = _app_cache[key]
+
+        # An application loaded with force_init has skipped version checks
+        # and must not be handed out to a regular invocation.
+        if cached_mtime == mtime and (force_init or not cached_force_init):
+            logger.debug("Using cached application for %s" % workdir)
+            return app
+
+    app = Application.from_workdir(
+        workdir=workdir,
+        force_init=force_init,
+        use_versions=use_versions,
+        filenames=[kraftfile],
+    )
+
+    _app_cache[key] = (mtime, force_init, app)
+
+    return app
+
+
+def _log_traceback_if_verbose(ctx):
+    """
+    Logs the traceback of the exception currently being handled, only
+    formatting it when running in verbose mode.
+    """
+
+    if ctx.obj.verbose:
+        logger.critical(traceback.format_exc())
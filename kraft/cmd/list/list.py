@@ -264,11 +264,18 @@ def cmd_list(ctx, show_installed=False, show_core=False, show_plats=False,
                 click.echo(output[:-1])
 
 
-# Pre-flight check determines if we are trying to work with nothing
+# Pre-flight check determines if we are trying to work with nothing.  It is
+# only performed once per invocation of kraft, since commands may forward to
+# or call into each other (e.g. configure retrying after pulling a component).
 @click.pass_context
 def kraft_list_preflight(ctx):
+    if ctx.obj.preflight_done:
+        return
+
     if ctx.obj.cache.is_stale():
         if click.confirm(
             'kraft caches are out-of-date. Would you like to update?',
                 default=True):
             kraft_update()
+
+    ctx.obj.preflight_done = True
@@ -63,6 +63,7 @@ class KraftContext:
     _assume_yes = False
     _dont_checkout = False
     _ignore_checkout_errors = False
+    _preflight_done = False
 
     def __init__(self, verbose=False, dont_checkout=False,
                  ignore_checkout_errors=False, assume_yes=False):
@@ -188,6 +189,14 @@ class KraftContext:
     def assume_yes(self, assume_yes=False):
         self._assume_yes = assume_yes
 
+    @property
+    def preflight_done(self):
+        return self._preflight_done
+
+    @preflight_done.setter
+    def preflight_done(self, preflight_done):
+        self._preflight_done = preflight_done
+
     @property
     def env(self):
         return self._env
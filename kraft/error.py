@@ -114,6 +114,13 @@ class CannotConfigureApplication(KraftError):
         )
 
 
+class UnknownTarget(KraftError):
+    def __init__(self, name):
+        super(UnknownTarget, self).__init__(
+            "The provided target is not defined by the application: %s" % name
+        )
+
+
 class InvalidInterpolation(KraftError):
     pass
 
@@ -0,0 +1,143 @@
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Authors: Alexander Jung <alexander.jung@neclab.eu>
+#
+# Copyright (c) 2020, NEC Europe Ltd., NEC Corporation. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+from click.testing import CliRunner
+
+from .. import mock
+from .. import unittest
+from kraft.cmd.configure import cmd_configure
+from kraft.error import UnknownTarget
+
+
+class ConfigureOptionsTestCase(unittest.TestCase):
+    def setUp(self):
+        patches = [
+            mock.patch('kraft.cmd.configure.kraft_list_preflight'),
+            mock.patch('kraft.cmd.configure.kraft_configure'),
+            mock.patch('kraft.cmd.configure.logger'),
+        ]
+        _, self.kraft_configure, self.logger = [p.start() for p in patches]
+        for p in patches:
+            self.addCleanup(p.stop)
+
+        self.obj = mock.MagicMock(verbose=False)
+
+    def invoke(self, args):
+        return CliRunner().invoke(cmd_configure, args, obj=self.obj)
+
+    def test_options(self):
+        result = self.invoke(['-y', 'FOO', '-n', 'BAR', '-s', 'BAZ=1'])
+        assert result.exit_code == 0
+        assert self.kraft_configure.call_args[1]['options'] == [
+            'CONFIG_FOO=y', 'CONFIG_BAR=n', 'CONFIG_BAZ=1'
+        ]
+
+    def test_prefixed_option(self):
+        result = self.invoke(['-y', 'CONFIG_FOO', '-s', 'CONFIG_BAR=1'])
+        assert result.exit_code == 0
+        assert self.kraft_configure.call_args[1]['options'] == [
+            'CONFIG_FOO=y', 'CONFIG_BAR=1'
+        ]
+
+    def test_duplicate_option(self):
+        result = self.invoke(['-y', 'FOO', '-y', 'CONFIG_FOO'])
+        assert result.exit_code == 1
+        self.logger.critical.assert_called_once_with(
+            'Cannot specify same option with multiple values: CONFIG_FOO'
+        )
+        self.kraft_configure.assert_not_called()
+
+    def test_conflicting_options(self):
+        result = self.invoke(['-y', 'FOO', '-n', 'FOO'])
+        assert result.exit_code == 1
+        self.logger.critical.assert_called_once_with(
+            'Cannot specify same option with multiple values: CONFIG_FOO'
+        )
+        self.kraft_configure.assert_not_called()
+
+    def test_duplicate_set_option(self):
+        result = self.invoke(['-s', 'FOO=1', '-s', 'FOO=2'])
+        assert result.exit_code == 1
+        self.logger.critical.assert_called_once_with(
+            'Cannot specify same option with multiple values: CONFIG_FOO'
+        )
+        self.kraft_configure.assert_not_called()
+
+    def test_missing_set_value(self):
+        result = self.invoke(['-s', 'FOO'])
+        assert result.exit_code == 1
+        self.logger.critical.assert_called_once_with(
+            'Missing value for --set option: CONFIG_FOO'
+        )
+        self.kraft_configure.assert_not_called()
+
+
+class ConfigureTargetTestCase(unittest.TestCase):
+    def setUp(self):
+        self.targets = [mock.MagicMock(), mock.MagicMock()]
+        self.targets[0].name = 'a'
+        self.targets[1].name = 'b'
+
+        self.app = mock.MagicMock()
+        self.app.is_configured.return_value = False
+        self.app.config.targets.all.return_value = self.targets
+        self.app.binaries = self.targets
+
+        patches = [
+            mock.patch('kraft.cmd.configure.kraft_list_preflight'),
+            mock.patch('kraft.cmd.configure._load_app_cached',
+                       return_value=self.app),
+            mock.patch('kraft.cmd.configure.logger'),
+        ]
+        _, _, self.logger = [p.start() for p in patches]
+        for p in patches:
+            self.addCleanup(p.stop)
+
+        self.obj = mock.MagicMock(verbose=False)
+        self.obj.env.get_boolean.return_value = False
+
+    def invoke(self, args):
+        return CliRunner().invoke(cmd_configure, args, obj=self.obj)
+
+    def test_target(self):
+        result = self.invoke(['--target', 'b'])
+        assert result.exit_code == 0
+        assert self.app.configure.call_args[1]['target'] is self.targets[1]
+
+    def test_unknown_target(self):
+        result = self.invoke(['--target', 'nope'])
+        assert result.exit_code == 1
+        self.logger.critical.assert_called_once_with(
+            str(UnknownTarget('nope'))
+        )
+        self.app.configure.assert_not_called()